@@ -15,15 +15,16 @@ Useful for spatial sensitivity analysis and identifying erosion hotspots.
 import numpy as np
 import pyvista as pv
 
-def compute_erosion_map(grid_before, grid_after):
+def compute_erosion_map(grid_before, grid_after, out=None):
     """
     Compute the voxel-wise erosion amount.
     :param grid_before: 3D numpy array before erosion.
     :param grid_after: 3D numpy array after erosion.
+    :param out: Optional preallocated array to write the result into.
     :return: 3D numpy array of erosion amounts.
     """
-    erosion = grid_before - grid_after
-    erosion[erosion < 0] = 0  # no negative erosion
+    erosion = np.subtract(grid_before, grid_after, out=out)
+    np.maximum(erosion, 0, out=erosion)  # no negative erosion
     return erosion
 
 def plot_erosion_heatmap(erosion_grid, threshold=0.0):
@@ -32,10 +33,9 @@ def plot_erosion_heatmap(erosion_grid, threshold=0.0):
     :param erosion_grid: 3D numpy array of erosion deltas.
     :param threshold: Only show values above this.
     """
-    indices = np.argwhere(erosion_grid > threshold)
-    values = erosion_grid[tuple(indices.T)]
-
-    indices = np.array(indices, dtype=np.float32)
+    mask = erosion_grid > threshold
+    values = erosion_grid[mask].astype(np.float32, copy=False)  # same C order as argwhere
+    indices = np.argwhere(mask).astype(np.float32)
 
     cloud = pv.PolyData(indices)
     cloud['erosion'] = values
@@ -21,7 +21,7 @@ import matplotlib.pyplot as plt
 
 class MassTracker:
     def __init__(self, mass_history):
-        self.history = np.array(mass_history)
+        self.history = np.asarray(mass_history, dtype=np.float64)
 
     def compute_summary(self):
         if (self.history is None) or (len(self.history) == 0):
@@ -31,7 +31,11 @@ class MassTracker:
         total_loss = initial - final
         avg_rate = total_loss / len(self.history)
         half_mass = initial / 2.0
-        half_time = next((i for i, m in enumerate(self.history) if m <= half_mass), None)
+
+        # Erosion only removes mass, so the history is non-increasing and the
+        # first step at or below half mass can be found with a binary search.
+        half_idx = int(np.searchsorted(-self.history, -half_mass))
+        half_time = half_idx if half_idx < len(self.history) else None
 
         return {
             'initial_mass': initial,
@@ -0,0 +1,81 @@
+"""
+This module holds compiled (Numba) kernels for the VoxelModel hot paths.
+
+Numba is optional. When it is not installed, NUMBA_AVAILABLE is False, the
+kernels below are not defined, and VoxelModel falls back to its pure NumPy
+implementations.
+
+If the optional Cython build of _voxel_kernels.pyx has been compiled,
+CYTHON_AVAILABLE is True and cython_exposed_mask is exported for VoxelModel
+to prefer over the Numba kernel.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from ._voxel_kernels import exposed_mask as cython_exposed_mask
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(inline='always')
+    def neighbor_bounds(d, n):
+        """
+        Return (lo, hi) such that the neighbor i + d lies inside an axis of length n exactly
+        when lo <= i < hi. Shared by every kernel that tests the upstream neighbor.
+        """
+        return max(0, -d), min(n, n - d)
+
+    @njit(parallel=True, cache=True)
+    def exposed_mask(grid, dx, dy, dz, out):
+        """
+        Flag voxels that contain soap and whose neighbor at (x + dx, y + dy, z + dz)
+        is empty or lies outside the grid.
+
+        :param grid: 3D voxel array.
+        :param dx, dy, dz: Integer neighbor offset (the rounded flow vector).
+        :param out: Preallocated boolean array with the same shape as grid.
+        """
+        nx, ny, nz = grid.shape
+
+        # The x and y bounds tests are hoisted out of the inner loop, which only checks z
+        lo_x, hi_x = neighbor_bounds(dx, nx)
+        lo_y, hi_y = neighbor_bounds(dy, ny)
+        lo_z, hi_z = neighbor_bounds(dz, nz)
+
+        for x in prange(nx):
+            x_inside = lo_x <= x < hi_x
+            for y in range(ny):
+                xy_inside = x_inside and lo_y <= y < hi_y
+                for z in range(nz):
+                    if grid[x, y, z] <= 0.0:
+                        out[x, y, z] = False
+                    elif xy_inside and lo_z <= z < hi_z:
+                        out[x, y, z] = grid[x + dx, y + dy, z + dz] <= 0.0
+                    else:
+                        # Voxels on the outer boundary are considered exposed
+                        out[x, y, z] = True
+
+    @njit(cache=True)
+    def erode_offsets(flat_grid, offsets, rates, threshold):
+        """
+        Subtract rates[i] from flat_grid[offsets[i]] in place, zeroing voxels left below threshold.
+
+        Runs serially so repeated offsets erode cumulatively, like a plain per-voxel loop.
+        Offsets are not bounds-checked; callers validate them (e.g., with np.ravel_multi_index).
+
+        :param flat_grid: 1D view of a C-contiguous voxel array, updated in place.
+        :param offsets: (N,) array of flat voxel offsets.
+        :param rates: (N,) array of erosion amounts (may be a zero-stride broadcast of a scalar).
+        :param threshold: Values below this are considered fully eroded.
+        """
+        for i in range(offsets.shape[0]):
+            new_value = flat_grid[offsets[i]] - rates[i]
+            flat_grid[offsets[i]] = 0 if new_value < threshold else new_value
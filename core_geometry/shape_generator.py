@@ -18,8 +18,58 @@ parametric definition of fuel rods, pellets, or assemblies in tools like
 Serpent, OpenMC, or MCNP.
 """
 
+from functools import lru_cache
 import numpy as np
 
+# Shape masks are memoized per (shape, parameters) so repeated VoxelModel
+# construction (e.g., every web preview) costs a copy instead of a rebuild.
+# The cached templates are read-only boolean arrays (1 byte per voxel); the
+# public make_* functions hand out float32 copies.
+
+def _read_only(grid):
+    grid.flags.writeable = False
+    return grid
+
+def _broadcast_axes(shape):
+    """
+    Return normalized [-1, 1] coordinates for each axis, shaped (nx, 1, 1),
+    (1, ny, 1) and (1, 1, nz) so they broadcast to the full grid without
+    materializing a 3D meshgrid.
+    """
+    nx, ny, nz = shape
+    x = np.linspace(-1, 1, nx).reshape(nx, 1, 1)
+    y = np.linspace(-1, 1, ny).reshape(1, ny, 1)
+    z = np.linspace(-1, 1, nz).reshape(1, 1, nz)
+    return x, y, z
+
+def make_template(geometry, shape):
+    """
+    Return the shared, read-only boolean mask for a named geometry.
+    Models of the same geometry and size all reference this single template.
+    :param geometry: 'cuboid', 'ellipsoid', 'cylinder', or 'rounded_cuboid'
+    :param shape: Tuple of (nx, ny, nz)
+    :return: Read-only 3D boolean numpy array
+    """
+    shape = tuple(shape)
+    if geometry == 'cuboid':
+        return _cuboid_template(shape)
+    elif geometry == 'ellipsoid':
+        return _ellipsoid_template(shape)
+    elif geometry == 'cylinder':
+        return _cylinder_template(shape, 'z')
+    elif geometry == 'rounded_cuboid':
+        return _rounded_cuboid_template(shape, 6)
+    else:
+        raise ValueError(f"Unsupported geometry: {geometry}")
+
+def prewarm(sizes_and_geoms):
+    """
+    Build and cache templates ahead of time so later VoxelModel construction is a copy.
+    :param sizes_and_geoms: Iterable of (shape, geometry) pairs
+    """
+    for shape, geometry in sizes_and_geoms:
+        make_template(geometry, shape)
+
 def make_cuboid(shape):
     """
     Create a full cuboid (solid block).
@@ -28,21 +78,23 @@ def make_cuboid(shape):
     """
     return np.ones(shape, dtype=np.float32)
 
+@lru_cache(maxsize=32)
+def _cuboid_template(shape):
+    return _read_only(np.ones(shape, dtype=np.bool_))
+
 def make_ellipsoid(shape):
     """
     Create an ellipsoid centered in the array.
     :param shape: Tuple of (nx, ny, nz)
     :return: 3D numpy array with ellipsoid voxels set to 1.0
     """
-    nx, ny, nz = shape
-    x = np.linspace(-1, 1, nx)
-    y = np.linspace(-1, 1, ny)
-    z = np.linspace(-1, 1, nz)
-    X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
-    mask = (X**2 + Y**2 + Z**2) <= 1.0
-    grid = np.zeros(shape, dtype=np.float32)
-    grid[mask] = 1.0
-    return grid
+    return _ellipsoid_template(tuple(shape)).astype(np.float32)
+
+@lru_cache(maxsize=32)
+def _ellipsoid_template(shape):
+    x, y, z = _broadcast_axes(shape)
+    mask = (x**2 + y**2 + z**2) <= 1.0
+    return _read_only(mask)
 
 def make_cylinder(shape, axis='z'):
     """
@@ -51,32 +103,24 @@ def make_cylinder(shape, axis='z'):
     :param axis: 'x', 'y', or 'z'
     :return: 3D numpy array
     """
-    nx, ny, nz = shape
-    grid = np.zeros(shape, dtype=np.float32)
+    return _cylinder_template(tuple(shape), axis).astype(np.float32)
+
+@lru_cache(maxsize=32)
+def _cylinder_template(shape, axis):
+    x, y, z = _broadcast_axes(shape)
 
+    # The 2D cross-section keeps a length-1 dimension along the cylinder axis,
+    # so a single broadcast extrudes it through the whole grid.
     if axis == 'z':
-        x = np.linspace(-1, 1, nx)
-        y = np.linspace(-1, 1, ny)
-        X, Y = np.meshgrid(x, y, indexing='ij')
-        mask = (X**2 + Y**2) <= 1.0
-        for z in range(nz):
-            grid[:, :, z][mask] = 1.0
+        mask = (x**2 + y**2) <= 1.0
     elif axis == 'y':
-        x = np.linspace(-1, 1, nx)
-        z = np.linspace(-1, 1, nz)
-        X, Z = np.meshgrid(x, z, indexing='ij')
-        mask = (X**2 + Z**2) <= 1.0
-        for y in range(ny):
-            grid[:, y, :][mask] = 1.0
+        mask = (x**2 + z**2) <= 1.0
     elif axis == 'x':
-        y = np.linspace(-1, 1, ny)
-        z = np.linspace(-1, 1, nz)
-        Y, Z = np.meshgrid(y, z, indexing='ij')
-        mask = (Y**2 + Z**2) <= 1.0
-        for x in range(nx):
-            grid[x, :, :][mask] = 1.0
+        mask = (y**2 + z**2) <= 1.0
+    else:
+        mask = np.zeros((1, 1, 1), dtype=np.bool_)
 
-    return grid
+    return _read_only(np.broadcast_to(mask, shape).copy())
 
 def make_rounded_cuboid(shape, exponent=6):
     """
@@ -86,12 +130,10 @@ def make_rounded_cuboid(shape, exponent=6):
     :param exponent: Controls roundness; higher = boxier.
     :return: 3D numpy array
     """
-    nx, ny, nz = shape
-    x = np.linspace(-1, 1, nx)
-    y = np.linspace(-1, 1, ny)
-    z = np.linspace(-1, 1, nz)
-    X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
-    mask = (np.abs(X) ** exponent + np.abs(Y) ** exponent + np.abs(Z) ** exponent) <= 1.0
-    grid = np.zeros(shape, dtype=np.float32)
-    grid[mask] = 1.0
-    return grid
+    return _rounded_cuboid_template(tuple(shape), exponent).astype(np.float32)
+
+@lru_cache(maxsize=32)
+def _rounded_cuboid_template(shape, exponent):
+    x, y, z = _broadcast_axes(shape)
+    mask = (np.abs(x) ** exponent + np.abs(y) ** exponent + np.abs(z) ** exponent) <= 1.0
+    return _read_only(mask)
@@ -22,31 +22,71 @@ cell in a core simulator.
 
 from typing import Tuple, List, Union
 import numpy as np
-from .shape_generator import make_cuboid, make_ellipsoid, make_cylinder, make_rounded_cuboid
+from .shape_generator import make_template
+from ._kernels import NUMBA_AVAILABLE, CYTHON_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from ._kernels import exposed_mask, erode_offsets
+if CYTHON_AVAILABLE:
+    from ._kernels import cython_exposed_mask
+
+# Density of a fully intact voxel in fixed-point (uint16) mode
+FIXED_POINT_SCALE = 65535
+
+# Voxels whose density falls below this fraction are considered fully eroded
+ERODED_THRESHOLD = 1e-4
+
+# Roughly one L2 cache worth of per-index work (offset, value and rate) per block
+_ERODE_BLOCK = (1 << 20) // 32
+
+
+def _shift_slices(offset: int, n: int) -> Tuple[slice, slice]:
+    """
+    Return (destination, source) slices along one axis such that
+    out[destination] = arr[source] places arr[i + offset] at out[i].
+    """
+    if offset >= 0:
+        return slice(0, max(n - offset, 0)), slice(offset, n)
+    return slice(-offset, n), slice(0, max(n + offset, 0))
+
+
+def _merge_repeats(offsets: np.ndarray, rate: Union[float, np.ndarray]) -> Tuple[np.ndarray, Union[float, np.ndarray]]:
+    """
+    Sort flat grid offsets and collapse repeated offsets into one entry whose rate is the sum
+    of its occurrences, so a voxel listed n times erodes n times, as in a per-voxel loop.
+    """
+    unique_offsets, first, inverse = np.unique(offsets, return_index=True, return_inverse=True)
+    if len(unique_offsets) == len(offsets):
+        return unique_offsets, (np.asarray(rate)[first] if np.ndim(rate) > 0 else rate)
+
+    rates = np.broadcast_to(np.asarray(rate, dtype=np.float64), offsets.shape)
+    return unique_offsets, np.bincount(inverse.reshape(-1), weights=rates, minlength=len(unique_offsets))
 
 
 class VoxelModel:
-    def __init__(self, size: Tuple[int, int, int] = (30, 30, 10), voxel_resolution: float = 1.0, geometry: str = 'cuboid') -> None:
+    def __init__(self, size: Tuple[int, int, int] = (30, 30, 10), voxel_resolution: float = 1.0, geometry: str = 'cuboid',
+                 fixed_point: bool = False) -> None:
         """
         Initialize the voxel grid representing the soap bar.
 
         :param size: Dimensions of the voxel grid (nx, ny, nz).
         :param voxel_resolution: Real-world size of each voxel in mm or cm.
         :param geometry: Shape of the soap bar ('cuboid', 'ellipsoid', 'cylinder', 'rounded_cuboid').
+        :param fixed_point: Store densities as uint16 in units of 1/FIXED_POINT_SCALE instead of float32.
+                            Halves grid and snapshot memory at about the same per-step speed;
+                            erosion amounts are rounded to the nearest unit.
         """
         self.size: Tuple[int, int, int] = size
         self.res: float = voxel_resolution
+        self.fixed_point: bool = fixed_point
+        self.scale: float = float(FIXED_POINT_SCALE) if fixed_point else 1.0  # Grid value of an intact voxel
+        self.threshold: float = ERODED_THRESHOLD * self.scale  # Grid value below which a voxel is fully eroded
 
-        if geometry == 'cuboid':
-            self.grid = make_cuboid(size)
-        elif geometry == 'ellipsoid':
-            self.grid = make_ellipsoid(size)
-        elif geometry == 'cylinder':
-            self.grid = make_cylinder(size)
-        elif geometry == 'rounded_cuboid':
-            self.grid = make_rounded_cuboid(size, exponent=6)
-        else:
-            raise ValueError(f"Unsupported geometry: {geometry}")
+        # Pristine shape mask, shared with every other model of the same geometry and size
+        self._template = make_template(geometry, size)
+        self.grid = self._template.astype(np.uint16 if fixed_point else np.float32)
+        if fixed_point:
+            self.grid *= FIXED_POINT_SCALE
 
     def get_mass(self, density: float = 1.0) -> float:
         """
@@ -55,11 +95,11 @@ class VoxelModel:
         :param density: Mass per voxel unit (adjustable for different materials).
         :return: Total mass as a float.
         """
-        return float(np.sum(self.grid) * density * (self.res ** 3))
+        return float(np.sum(self.grid) / self.scale * density * (self.res ** 3))
 
-    def get_exposed_surface_voxels(self, flow_vector: Tuple[int, int, int]) -> np.ndarray:
+    def get_exposed_surface_mask(self, flow_vector: Tuple[int, int, int]) -> np.ndarray:
         """
-        Return surface voxels that are directly exposed to the incoming flow.
+        Return a boolean mask of surface voxels that are directly exposed to the incoming flow.
 
         A voxel is considered exposed if it:
         - Contains soap (value > 0), AND
@@ -67,51 +107,164 @@ class VoxelModel:
           OR lies on the edge of the grid.
 
         :param flow_vector: Direction of incoming water flow (e.g., (0, 0, -1) for top-down).
-        :return: Numpy array of index tuples (x, y, z) for exposed surface voxels.
+        :return: Boolean array with the grid's shape, True for exposed surface voxels.
         """
         direction = np.round(flow_vector).astype(int)
-        mask = self.grid > 0.0
-        exposed_voxels = []
-
-        nx, ny, nz = self.grid.shape
-        for x in range(nx):
-            for y in range(ny):
-                for z in range(nz):
-                    if not mask[x, y, z]:
-                        continue
-
-                    neighbor = np.array([x, y, z]) + direction
-                    if (
-                        0 <= neighbor[0] < nx and
-                        0 <= neighbor[1] < ny and
-                        0 <= neighbor[2] < nz
-                    ):
-                        if self.grid[tuple(neighbor)] <= 0.0:
-                            exposed_voxels.append((x, y, z))
-                    else:
-                        # Voxels on the outer boundary are considered exposed
-                        exposed_voxels.append((x, y, z))
-
-        return np.array(exposed_voxels)
-
-    def erode_voxels(self, indices: Union[List[Tuple[int, int, int]], np.ndarray], rate: float) -> None:
-        """
-        Reduce the density value of each voxel by a fixed rate.
+        dx, dy, dz = int(direction[0]), int(direction[1]), int(direction[2])
+
+        if CYTHON_AVAILABLE and self.grid.flags.c_contiguous:
+            exposed = np.empty(self.grid.shape, dtype=np.bool_)
+            cython_exposed_mask(self.grid, dx, dy, dz, exposed.view(np.uint8))
+            return exposed
+
+        # Numba does not vectorize 16-bit compares well, so NumPy is the faster path for fixed-point grids
+        if NUMBA_AVAILABLE and not self.fixed_point:
+            exposed = np.empty(self.grid.shape, dtype=np.bool_)
+            exposed_mask(self.grid, dx, dy, dz, exposed)
+            return exposed
+
+        solid = self.grid > 0.0
+
+        # neighbor_solid[x, y, z] is True when the voxel at (x, y, z) + direction holds soap.
+        # Neighbors outside the grid stay False, so boundary voxels count as exposed.
+        neighbor_solid = np.zeros_like(solid)
+        dst, src = zip(*(_shift_slices(d, n) for d, n in zip(direction, solid.shape)))
+        neighbor_solid[dst] = solid[src]
+
+        return solid & ~neighbor_solid
+
+    def get_exposed_surface_voxels(self, flow_vector: Tuple[int, int, int]) -> np.ndarray:
+        """
+        Return indices of surface voxels that are directly exposed to the incoming flow.
+        See get_exposed_surface_mask for the exposure rule.
+
+        :param flow_vector: Direction of incoming water flow (e.g., (0, 0, -1) for top-down).
+        :return: (N, 3) int32 array of (x, y, z) indices for exposed surface voxels.
+        """
+        return np.argwhere(self.get_exposed_surface_mask(flow_vector)).astype(np.int32)
+
+    def get_surface_mask(self) -> np.ndarray:
+        """
+        Return a boolean mask of all surface voxels, regardless of flow direction.
+
+        A voxel is on the surface if it contains soap and at least one of its six
+        axial neighbors is empty or lies outside the grid.
+
+        :return: Boolean array with the grid's shape, True for surface voxels.
+        """
+        solid = self.grid > 0.0
+
+        # Interior voxels hold soap in all six axial neighbors; voxels on the grid faces never do.
+        interior = solid.copy()
+        interior[1:, :, :] &= solid[:-1, :, :]
+        interior[:-1, :, :] &= solid[1:, :, :]
+        interior[:, 1:, :] &= solid[:, :-1, :]
+        interior[:, :-1, :] &= solid[:, 1:, :]
+        interior[:, :, 1:] &= solid[:, :, :-1]
+        interior[:, :, :-1] &= solid[:, :, 1:]
+        interior[[0, -1], :, :] = False
+        interior[:, [0, -1], :] = False
+        interior[:, :, [0, -1]] = False
+
+        return solid & ~interior
+
+    def get_surface_voxels(self) -> np.ndarray:
+        """
+        Return indices of all surface voxels. See get_surface_mask for the surface rule.
+
+        :return: (N, 3) int32 array of (x, y, z) indices for surface voxels.
+        """
+        return np.argwhere(self.get_surface_mask()).astype(np.int32)
+
+    def erode_voxels(self, indices: Union[List[Tuple[int, int, int]], np.ndarray], rate: Union[float, np.ndarray]) -> None:
+        """
+        Reduce the density value of each voxel by the given rate.
 
         If a voxel drops below a small threshold, it is considered fully eroded and set to zero.
+        A voxel listed more than once is eroded once per occurrence.
+
+        :param indices: List or array of voxel (x, y, z) indices inside the grid; ValueError otherwise.
+        :param rate: Amount to subtract from each voxel's value, either a scalar or one value per voxel.
+        """
+        idx = np.asarray(indices)
+        if idx.size == 0:
+            return
+
+        idx = idx.reshape(-1, 3)
+        # Flat offsets for every path below; raises ValueError for indices outside the grid
+        offsets = np.ravel_multi_index((idx[:, 0], idx[:, 1], idx[:, 2]), self.grid.shape)
+
+        rate = self._grid_rate(rate)
+
+        if NUMBA_AVAILABLE and self.grid.flags.c_contiguous:
+            # In-place scatter with no gathered temporaries
+            rates = np.broadcast_to(np.asarray(rate, dtype=np.int32 if self.fixed_point else self.grid.dtype),
+                                    offsets.shape)
+            erode_offsets(self.grid.reshape(-1), offsets, rates, self.threshold)
+            return
+
+        # A fancy-index scatter applies a repeated index once, so merge repeats up front
+        offsets, rate = _merge_repeats(offsets, rate)
+
+        if self.grid.flags.c_contiguous:
+            self._erode_blocked(offsets, rate)
+            return
+
+        xs, ys, zs = np.unravel_index(offsets, self.grid.shape)
+        self.grid[xs, ys, zs] = self._subtract_rate(self.grid[xs, ys, zs], rate)
 
-        :param indices: List or array of voxel (x, y, z) indices.
-        :param rate: Amount to subtract from each voxel's value.
+    def _erode_blocked(self, offsets: np.ndarray, rate: Union[float, np.ndarray]) -> None:
         """
-        for idx in indices:
-            new_value = self.grid[tuple(idx)] - rate
-            self.grid[tuple(idx)] = 0.0 if new_value < 1e-4 else new_value
+        Erode voxels given by unique, ascending flat grid offsets in cache-sized blocks,
+        so each block's gather, subtract and scatter stay in cache.
+        """
+        per_voxel = np.ndim(rate) > 0
+        flat_grid = self.grid.reshape(-1)  # view, since the grid is C-contiguous
+        for start in range(0, len(offsets), _ERODE_BLOCK):
+            block = slice(start, start + _ERODE_BLOCK)
+            block_offsets = offsets[block]
+            flat_grid[block_offsets] = self._subtract_rate(flat_grid[block_offsets], rate[block] if per_voxel else rate)
+
+    def erode_mask(self, mask: np.ndarray, rate: Union[float, np.ndarray]) -> None:
+        """
+        Reduce the density value of every voxel selected by a boolean mask.
+
+        Same thresholding as erode_voxels, without materializing an index array.
+
+        :param mask: Boolean array with the grid's shape.
+        :param rate: Amount to subtract from each selected voxel, either a scalar or one value
+                     per selected voxel in C (x, y, z) order, as returned by np.argwhere(mask).
+        """
+        self.grid[mask] = self._subtract_rate(self.grid[mask], self._grid_rate(rate))
+
+    def _grid_rate(self, rate: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Convert an erosion rate from density units to grid units: rounded to whole
+        int32 units in fixed-point mode, unchanged otherwise.
+        """
+        if self.fixed_point:
+            return np.rint(np.multiply(rate, self.scale)).astype(np.int32)
+        return rate
+
+    def _subtract_rate(self, values: np.ndarray, rate: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Subtract an erosion rate (in grid units) from gathered voxel values and zero
+        out any voxel left below the erosion threshold.
+        """
+        if self.fixed_point:
+            values = values.astype(np.int32)
+
+        new_values = values - rate
+        new_values[new_values < self.threshold] = 0
+        return new_values
 
     def reset(self) -> None:
         """
-        Reset the entire voxel grid to a full (uneaten) state of value = 1.0.
+        Reset the voxel grid to its original (uneaten) shape, with soap voxels at full density.
         """
-        self.grid[:] = 1.0
+        np.copyto(self.grid, self._template)
+        if self.fixed_point:
+            self.grid *= FIXED_POINT_SCALE
 
     def summary(self) -> None:
         """
@@ -3,14 +3,27 @@ from flask import Flask, request, send_file
 from flask_cors import CORS
 import yaml
 import os
+import threading
 import pyvista as pv
 
 from core_geometry.voxel_model import VoxelModel
+from core_geometry.shape_generator import prewarm
 from visualization.flow_vector import visualize_flow_debug_scene
 
 # Enable offscreen rendering on Windows/macOS
 pv.global_theme.window_size = [800, 600]
 
+# Reuse one offscreen plotter across requests; render window setup dominates small previews.
+# The lock serializes access when the app runs under a multi-threaded server.
+_PLOTTER = pv.Plotter(off_screen=True)
+_PLOTTER_LOCK = threading.Lock()
+
+# Cache the configured soap shape at startup so the first preview does not pay for it
+if os.path.exists("parameters.yaml"):
+    with open("parameters.yaml", 'r') as f:
+        soap_cfg = yaml.safe_load(f)['soap']
+    prewarm([(tuple(soap_cfg['size']), soap_cfg.get('geometry', 'cuboid'))])
+
 app = Flask(__name__, static_folder="static")
 CORS(app)
 
@@ -29,10 +42,11 @@ def generate_preview():
         water_source_height = config['erosion_model'].get('water_source_height', 1.0)
 
         # Offscreen rendering
-        plotter = pv.Plotter(off_screen=True)
-        visualize_flow_debug_scene(vm, flow_vector, water_source_height, plotter=plotter)
-        plotter.screenshot("./static/preview.png")
-        plotter.close()
+        with _PLOTTER_LOCK:
+            _PLOTTER.clear_actors()  # Keeps the lights, which clear() would remove
+            visualize_flow_debug_scene(vm, flow_vector, water_source_height, plotter=_PLOTTER)
+            _PLOTTER.view_isometric()  # Fit the camera to the new scene, as a fresh plotter would
+            _PLOTTER.screenshot("./static/preview.png")
 
         return {"status": "ok"}
 
@@ -20,10 +20,7 @@ import pprint
 import numpy as np
 
 # Core simulation components
-from core_geometry.voxel_model import VoxelModel
-from physics_models.deterministic_erosion import DeterministicErosionModel
-from physics_models.stochastic_erosion import StochasticErosionModel
-from simulation_engine.time_integrator import TimeIntegrator
+from simulation_engine.builder import build_simulation
 
 # Visualization utilities
 from visualization.render_voxel import render_voxel_grid
@@ -62,37 +59,17 @@ def main():
     print(f" - Log interval: {cfg['simulation']['log_interval']}")
     print("--------------------------------------\n")
 
-    # Initialize geometry (voxelized soap bar)
-    size = tuple(cfg['soap']['size'])
-    res = cfg['soap']['voxel_resolution']
-    vm = VoxelModel(size=size, voxel_resolution=res, geometry=cfg['soap'].get('geometry', 'cuboid'))
-
-    # Initialize erosion model based on type
+    # Build the voxel model, erosion model and time integrator from the configuration
+    sim = build_simulation(cfg)
+    vm = sim.vm
     em_cfg = cfg['erosion_model']
-    if em_cfg['type'] == 'deterministic':
-        eroder = DeterministicErosionModel(
-            flow_vector=em_cfg['flow_vector'],
-            erosion_rate=em_cfg['erosion_rate']
-        )
-    elif em_cfg['type'] == 'stochastic':
-        eroder = StochasticErosionModel(
-            flow_vector=em_cfg['flow_vector'],
-            erosion_mean=em_cfg['erosion_rate'],
-            erosion_std=em_cfg['erosion_std'],
-            erosion_fraction=em_cfg['erosion_fraction'],
-            seed=em_cfg.get('seed', None)
-        )
-    else:
-        raise ValueError("Unsupported erosion model type.")
+    log_int = cfg['simulation']['log_interval']
 
     # Visualize initial flow direction and voxel structure for debugging
     if cfg['simulation']['debug_vectors']: 
         visualize_flow_debug_scene(vm, flow_vector=em_cfg['flow_vector'], water_source_height=em_cfg['water_source_height'])
 
     # Run the simulation for configured number of steps
-    steps = cfg['simulation']['steps']
-    log_int = cfg['simulation']['log_interval']
-    sim = TimeIntegrator(vm, eroder, steps=steps)
     sim.run(log_interval=log_int, save_snapshots=True, water_source_height=em_cfg['water_source_height'])
 
     # Analyze and report final results
@@ -121,7 +98,7 @@ def main():
     # Optional: heatmap of erosion change
     if(cfg['simulation']['heat_map']):
         erosion_map = compute_erosion_map(snapshots[0], snapshots[-1])
-        plot_erosion_heatmap(erosion_map, threshold=0.01)
+        plot_erosion_heatmap(erosion_map, threshold=0.01 * vm.scale)
 
 if __name__ == '__main__':
     main()
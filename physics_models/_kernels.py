@@ -0,0 +1,103 @@
+"""
+This module holds compiled (Numba) kernels for the erosion models.
+
+Each kernel fuses a model's per-timestep NumPy pipeline into a single pass over
+the voxel grid. Numba is optional: when it is not installed, NUMBA_AVAILABLE is
+False, the kernels below are not defined, and the models fall back to their
+NumPy implementations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    from core_geometry._kernels import neighbor_bounds
+
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(inline='always')
+    def _exposure(vx, vy, vz, fx, fy, fz):
+        """
+        Exposure of a voxel at displacement (vx, vy, vz) from the erosion center: the clipped
+        cosine between that displacement and the flow vector, and 1.0 for a voxel at the center.
+        Same definition as vector_utils.compute_exposures.
+        """
+        distance = (vx * vx + vy * vy + vz * vz) ** 0.5
+        if distance == 0.0:
+            return 1.0
+        return max(0.0, (vx * fx + vy * fy + vz * fz) / distance)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def det_erosion_step(grid, dx, dy, dz, cx, cy, cz, fx, fy, fz, rate, threshold, quantize):
+        """
+        Apply one deterministic erosion timestep to the grid in place.
+
+        Fuses exposed-surface detection, exposure computation and erosion:
+        a voxel is eroded when it holds soap and its neighbor at (x + dx, y + dy, z + dz)
+        is empty or outside the grid, and loses _exposure(...) * rate.
+
+        :param grid: 3D voxel array (float32, or uint16 fixed-point), updated in place.
+        :param dx, dy, dz: Integer neighbor offset (the rounded flow vector).
+        :param cx, cy, cz: Erosion center (shifted water source).
+        :param fx, fy, fz: Normalized flow vector.
+        :param rate: Erosion rate per timestep, in grid units.
+        :param threshold: Values below this are considered fully eroded.
+        :param quantize: Round each erosion amount to a whole grid unit (for integer grids).
+        """
+        nx, ny, nz = grid.shape
+
+        lo_x, hi_x = neighbor_bounds(dx, nx)
+        lo_y, hi_y = neighbor_bounds(dy, ny)
+        lo_z, hi_z = neighbor_bounds(dz, nz)
+
+        # Voxels eroded away in this pass stay untouched in the grid until the second pass, and every
+        # surviving value stays at or above threshold, so neighbors always see the pre-step solid set.
+        eroded = np.zeros(grid.shape, dtype=np.bool_)
+
+        for x in prange(nx):
+            x_inside = lo_x <= x < hi_x
+            for y in range(ny):
+                xy_inside = x_inside and lo_y <= y < hi_y
+                for z in range(nz):
+                    value = grid[x, y, z]
+                    if value <= 0:
+                        continue
+
+                    if xy_inside and lo_z <= z < hi_z and grid[x + dx, y + dy, z + dz] > 0:
+                        continue
+
+                    amount = _exposure(x - cx, y - cy, z - cz, fx, fy, fz) * rate
+                    if quantize:
+                        amount = np.rint(amount)
+
+                    new_value = value - amount
+                    if new_value < threshold:
+                        eroded[x, y, z] = True
+                    else:
+                        grid[x, y, z] = new_value
+
+        for x in prange(nx):
+            for y in range(ny):
+                for z in range(nz):
+                    if eroded[x, y, z]:
+                        grid[x, y, z] = 0
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def exposures_kernel(voxels, cx, cy, cz, fx, fy, fz, out):
+        """
+        Compute the exposure of each voxel row into out (see _exposure), in parallel over rows.
+
+        :param voxels: (N, 3) array of voxel indices.
+        :param cx, cy, cz: Erosion center (shifted water source).
+        :param fx, fy, fz: Normalized flow vector.
+        :param out: Preallocated (N,) float32 array.
+        """
+        for i in prange(voxels.shape[0]):
+            out[i] = _exposure(voxels[i, 0] - cx, voxels[i, 1] - cy, voxels[i, 2] - cz, fx, fy, fz)
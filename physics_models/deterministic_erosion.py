@@ -19,7 +19,11 @@ fields determine deposition or erosion deterministically.
 
 import numpy as np
 from core_geometry.voxel_model import VoxelModel
-from physics_models.vector_utils import compute_exposures, compute_center, normalize_vector
+from physics_models.vector_utils import compute_exposures, normalize_vector, CenterCache
+from physics_models._kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from physics_models._kernels import det_erosion_step
 
 class DeterministicErosionModel:
     def __init__(self, flow_vector=(0, 0, -1), erosion_rate=0.01):
@@ -28,23 +32,31 @@ class DeterministicErosionModel:
         :param flow_vector: 3D tuple representing direction of water flow.
         :param erosion_rate: Base erosion rate per time step.
         """
-        self.flow_vector = np.array(flow_vector) / np.linalg.norm(flow_vector)
+        self.normalized_flow_vector = normalize_vector(flow_vector)
         self.erosion_rate = erosion_rate
+        self._centers = CenterCache(self.normalized_flow_vector)
 
     def apply(self, voxel_model: VoxelModel, water_source_height=1.0):
         """
         Apply one timestep of erosion.
         :param voxel_model: Instance of VoxelModel.
         """
-        surface_voxels = voxel_model.get_exposed_surface_voxels(self.flow_vector)
+        center = self._centers.get(voxel_model, water_source_height)
 
-        normalized_flow_vector = normalize_vector(self.flow_vector)
+        if NUMBA_AVAILABLE:
+            # Single fused pass: surface detection, exposure and erosion
+            dx, dy, dz = np.round(self.normalized_flow_vector).astype(int)
+            fx, fy, fz = self.normalized_flow_vector
+            det_erosion_step(voxel_model.grid, int(dx), int(dy), int(dz),
+                             float(center[0]), float(center[1]), float(center[2]),
+                             float(fx), float(fy), float(fz), float(self.erosion_rate * voxel_model.scale),
+                             float(voxel_model.threshold), voxel_model.fixed_point)
+            return
 
-        center = compute_center(voxel_model, normalized_flow_vector, water_source_height)
+        exposed = voxel_model.get_exposed_surface_mask(self.normalized_flow_vector)
 
-        exposure = compute_exposures(surface_voxels, center, normalized_flow_vector)
+        exposure = compute_exposures(np.argwhere(exposed), center, self.normalized_flow_vector)
 
-        erosion_values = np.array(exposure) * self.erosion_rate
+        erosion_values = np.asarray(exposure) * self.erosion_rate
 
-        for idx, er in zip(surface_voxels, erosion_values):
-            voxel_model.erode_voxels([idx], rate=er)
+        voxel_model.erode_mask(exposed, rate=erosion_values)
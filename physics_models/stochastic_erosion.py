@@ -16,10 +16,11 @@ Unlike deterministic field-based erosion, this reflects randomness in local flux
 
 import numpy as np
 from core_geometry.voxel_model import VoxelModel
-from physics_models.vector_utils import compute_exposures, compute_center, normalize_vector
+from physics_models.vector_utils import compute_exposures, normalize_vector, CenterCache
 
 class StochasticErosionModel:
-    def __init__(self, erosion_mean=0.01, erosion_std=0.005, erosion_fraction=0.2, seed=None, flow_vector=(0, 0, -1)):
+    def __init__(self, erosion_mean=0.01, erosion_std=0.005, erosion_fraction=0.2, seed=None, flow_vector=(0, 0, -1),
+                 steps_hint=None):
         """
         Initialize stochastic erosion parameters.
         :param erosion_mean: Mean erosion per event.
@@ -27,12 +28,19 @@ class StochasticErosionModel:
         :param erosion_fraction: Fraction of surface voxels to erode per timestep.
         :param seed: RNG seed for reproducibility.
         :param flow_vector: Direction of water flow (e.g., top-down = (0, 0, -1)).
+        :param steps_hint: Expected number of timesteps. If given, the normal variates for the whole run
+                           are drawn in one batch on the first timestep instead of once per step.
         """
         self.mean = erosion_mean
         self.std = erosion_std
         self.fraction = erosion_fraction
         self.rng = np.random.default_rng(seed)
-        self.normalized_flow_vector = normalize_vector(flow_vector)
+        # Contiguous float32, like the exposure arrays, so the exposure math never upcasts
+        self.normalized_flow_vector = np.ascontiguousarray(normalize_vector(flow_vector), dtype=np.float32)
+        self._centers = CenterCache(self.normalized_flow_vector)
+        self.steps_hint = steps_hint
+        self._normal_pool = None  # Pre-drawn standard normals, consumed from _pool_cursor onward
+        self._pool_cursor = 0
 
     def apply(self, voxel_model: VoxelModel, water_source_height=1.0):
         """
@@ -40,28 +48,46 @@ class StochasticErosionModel:
         :param voxel_model: Instance of VoxelModel.
         :param water_source_height: Controls source position for directional bias.
         """
-        surface_voxels = voxel_model.get_exposed_surface_voxels(self.normalized_flow_vector)
+        # (N, 3) int32 index array; a no-op for VoxelModel, which already returns this layout
+        surface_voxels = np.asarray(voxel_model.get_exposed_surface_voxels(self.normalized_flow_vector), dtype=np.int32)
         if len(surface_voxels) == 0:
             return
 
-        center = compute_center(voxel_model, self.normalized_flow_vector, water_source_height)
+        center = self._centers.get(voxel_model, water_source_height)
 
         exposures = compute_exposures(surface_voxels, center, self.normalized_flow_vector)
-        exposures = np.array(exposures)
-        total = exposures.sum()
-        if total == 0:
+        if not np.any(exposures):
             return  # No erosion if no voxel is facing the source
 
         exposures += 1e-6  # Tiny background exposure
-        probabilities = exposures / exposures.sum()
         k = int(len(surface_voxels) * self.fraction)
+        if k == 0:
+            return
 
-        sampled_indices = self.rng.choice(len(surface_voxels), size=k, replace=False, p=probabilities)
-        selected_voxels = [surface_voxels[i] for i in sampled_indices]
-        raw_amounts = self.rng.normal(loc=self.mean, scale=self.std, size=k)
+        # Weighted sampling without replacement (Efraimidis-Spirakis): each voxel draws an
+        # exponential key scaled down by its exposure, and the k smallest keys are selected.
+        keys = self.rng.standard_exponential(len(surface_voxels), dtype=np.float32) / exposures
+        sampled_indices = np.argpartition(keys, k - 1)[:k]
+        selected_voxels = surface_voxels[sampled_indices]
+        # float32 draws, matching the grid and exposure precision
+        raw_amounts = self.mean + self.std * self._standard_normals(k)
         raw_amounts = np.clip(raw_amounts, 0.0, None)  # Avoid negative erosion
         erosion_amounts = raw_amounts * exposures[sampled_indices]
 
+        voxel_model.erode_voxels(selected_voxels, rate=erosion_amounts)
+
+    def _standard_normals(self, k):
+        """
+        Return k float32 standard normal variates, taken from the pre-drawn pool while it lasts
+        and drawn on demand afterwards (or when no steps_hint was given).
+        """
+        if self.steps_hint and self._normal_pool is None:
+            # Size the pool from the first step's sample count
+            self._normal_pool = self.rng.standard_normal(self.steps_hint * k, dtype=np.float32)
+
+        if self._normal_pool is not None and self._pool_cursor + k <= len(self._normal_pool):
+            draws = self._normal_pool[self._pool_cursor:self._pool_cursor + k]
+            self._pool_cursor += k
+            return draws
 
-        for idx, amt in zip(selected_voxels, erosion_amounts):
-            voxel_model.erode_voxels([idx], rate=amt)
+        return self.rng.standard_normal(k, dtype=np.float32)
@@ -1,5 +1,13 @@
+import math
 import numpy as np
 from core_geometry.voxel_model import VoxelModel
+from physics_models._kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from physics_models._kernels import exposures_kernel
+
+# Rows per block in the NumPy exposure path; 8192 rows of float32 temporaries fit in L2
+_EXPOSURE_BLOCK = 8192
 
 def compute_exposures(surface_voxels, water_source, normalized_flow_vector):
     """
@@ -8,32 +16,42 @@ def compute_exposures(surface_voxels, water_source, normalized_flow_vector):
 
     :param surface_voxels: (N, 3) array of voxel indices.
     :param water_source: (3,) array representing a reference point (e.g., water source).
-    :param flow_vector: (3,) array indicating incoming flow direction.
-    :return: (N,) array of exposure values in [0, 1].
+    :param normalized_flow_vector: (3,) array indicating incoming flow direction.
+    :return: (N,) float32 array of exposure values in [0, 1].
     """
+    if NUMBA_AVAILABLE:
+        # Row-parallel kernel reads the integer indices directly, without float temporaries
+        surface_voxels = np.asarray(surface_voxels).reshape(-1, 3)
+        exposures = np.empty(len(surface_voxels), dtype=np.float32)
+        exposures_kernel(surface_voxels,
+                         float(water_source[0]), float(water_source[1]), float(water_source[2]),
+                         float(normalized_flow_vector[0]), float(normalized_flow_vector[1]), float(normalized_flow_vector[2]),
+                         exposures)
+        return exposures
 
-    exposures = []
-    for voxel in surface_voxels:
-        source_to_voxel_vector = np.array(voxel, dtype=float) - water_source # displacement vector
-        distance: int = np.linalg.norm(source_to_voxel_vector)
-
-        if distance == 0:
-            exposure_scalar = 1.0
-        else:
-            incident_direction = source_to_voxel_vector / distance
-            exposure_scalar = np.dot(incident_direction, normalized_flow_vector) # cosine
-            exposure_scalar = max(0.0, exposure_scalar)  # Only consider surfaces facing toward the flow
+    surface_voxels = np.asarray(surface_voxels).reshape(-1, 3)
+    source = np.asarray(water_source, dtype=np.float32)
+    flow = np.asarray(normalized_flow_vector, dtype=np.float32)
 
-        exposures.append(exposure_scalar)
+    # Work through the rows in cache-sized blocks so each block's temporaries stay in L1/L2
+    exposures = np.empty(len(surface_voxels), dtype=np.float32)
+    for start in range(0, len(surface_voxels), _EXPOSURE_BLOCK):
+        block = slice(start, start + _EXPOSURE_BLOCK)
+        _exposures_block(surface_voxels[block], source, flow, exposures[block])
+    return exposures
 
-    # untested vectorization with numpy
-    # directions = surface_voxels - center_point  # shape (N, 3)
-    # norms = np.linalg.norm(directions, axis=1, keepdims=True)
-    # normals = np.divide(directions, norms, out=np.zeros_like(directions), where=(norms != 0))
-    # dot_products = np.einsum('ij,j->i', normals, normalized_flow_vector)
-    # exposure = np.clip(dot_products, 0.0, None)
+def _exposures_block(surface_voxels, source, flow, out):
+    """
+    NumPy exposure computation for one block of rows, written into out (a float32 view).
+    """
+    source_to_voxel_vectors = surface_voxels.astype(np.float32) - source  # displacement vectors, (n, 3)
+    distances = np.linalg.norm(source_to_voxel_vectors, axis=1)
+    dot_products = np.einsum('ij,j->i', source_to_voxel_vectors, flow)
 
-    return np.array(exposures)
+    # Cosine of the incident angle; a voxel sitting exactly on the source is fully exposed
+    out.fill(1.0)
+    np.divide(dot_products, distances, out=out, where=(distances != 0))
+    np.clip(out, 0.0, None, out=out)  # Only consider surfaces facing toward the flow
 
 def compute_center(voxel_model: VoxelModel, normalized_flow_vector, water_source_height=0.0):
     grid_shape = np.array(voxel_model.grid.shape, dtype=float)
@@ -44,16 +62,39 @@ def compute_center(voxel_model: VoxelModel, normalized_flow_vector, water_source
 
     center = grid_shape / 2.0
     center = center + (-normalized_flow_vector) * total_offset
-    return center
+    return np.ascontiguousarray(center, dtype=np.float32)  # Same dtype as the exposure math
+
+class CenterCache:
+    """
+    Erosion center for one flow direction. It is invariant across timesteps, so it is
+    recomputed only when the grid geometry or source height changes.
+    """
+    def __init__(self, normalized_flow_vector):
+        self.normalized_flow_vector = normalized_flow_vector
+        self._center = None
+        self._key = None
+
+    def get(self, voxel_model: VoxelModel, water_source_height):
+        key = (voxel_model.grid.shape, tuple(voxel_model.size), water_source_height)
+        if key != self._key:
+            self._center = compute_center(voxel_model, self.normalized_flow_vector, water_source_height)
+            self._key = key
+        return self._center
 
 def normalize_vector(vector):
-    normalized_vector = np.array(vector, dtype=float) / np.linalg.norm(vector)
+    v = np.asarray(vector, dtype=float)
+    # Plain scalar arithmetic for a 3-vector; np.linalg.norm's dispatch costs more than the math
+    normalized_vector = v / math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
     return normalized_vector
 
 def compute_baseline_offset(voxel_model, normalized_flow_vector):
     # Half-size of the soap in each direction
     half_extents = np.array(voxel_model.size) / 2.0
 
+    # Axis-aligned flow (e.g., the default top-down (0, 0, -1)): the projection is a single half-extent
+    if np.count_nonzero(normalized_flow_vector) == 1:
+        return half_extents[np.argmax(np.abs(normalized_flow_vector))]
+
     # Project the half-extents onto the flow direction
     # This gives how far the soap extends in the flow direction
     directional_extent = np.abs(np.dot(half_extents, normalized_flow_vector))
@@ -0,0 +1,50 @@
+"""
+This module builds a ready-to-run simulation from a parsed configuration.
+
+Plans:
+- Translate a parameters.yaml-style dict into a VoxelModel, an erosion model and a TimeIntegrator.
+- Keep this translation in one place for every entry point (main.py, parameter sweeps).
+
+Nuclear Engineering Parallel:
+This is the input-deck processor step of codes like OpenMC or RELAP5: it turns
+user input into the solver's internal model objects before any physics runs.
+"""
+
+from core_geometry.voxel_model import VoxelModel
+from physics_models.deterministic_erosion import DeterministicErosionModel
+from physics_models.stochastic_erosion import StochasticErosionModel
+from simulation_engine.time_integrator import TimeIntegrator
+
+def build_simulation(cfg):
+    """
+    Construct the voxel model, erosion model and time integrator described by a configuration.
+    :param cfg: Configuration dict laid out like parameters.yaml.
+    :return: TimeIntegrator; its voxel model and erosion model are sim.vm and sim.eroder.
+    """
+    # Initialize geometry (voxelized soap bar)
+    soap_cfg = cfg['soap']
+    vm = VoxelModel(size=tuple(soap_cfg['size']), voxel_resolution=soap_cfg['voxel_resolution'],
+                    geometry=soap_cfg.get('geometry', 'cuboid'), fixed_point=soap_cfg.get('fixed_point', False))
+
+    steps = cfg['simulation']['steps']
+
+    # Initialize erosion model based on type
+    em_cfg = cfg['erosion_model']
+    if em_cfg['type'] == 'deterministic':
+        eroder = DeterministicErosionModel(
+            flow_vector=em_cfg['flow_vector'],
+            erosion_rate=em_cfg['erosion_rate']
+        )
+    elif em_cfg['type'] == 'stochastic':
+        eroder = StochasticErosionModel(
+            flow_vector=em_cfg['flow_vector'],
+            erosion_mean=em_cfg['erosion_rate'],
+            erosion_std=em_cfg['erosion_std'],
+            erosion_fraction=em_cfg['erosion_fraction'],
+            seed=em_cfg.get('seed', None),
+            steps_hint=steps
+        )
+    else:
+        raise ValueError("Unsupported erosion model type.")
+
+    return TimeIntegrator(vm, eroder, steps=steps)
@@ -0,0 +1,62 @@
+"""
+This module runs parameter sweeps: many independent simulations, one per configuration.
+
+Plans:
+- Accept a list of configurations in the same layout as parameters.yaml.
+- Run each configuration's full time integration in its own process, across all cores.
+- Return each run's mass history, and hand snapshots back as .npy files rather than
+  pickling large 4D arrays between processes.
+
+Nuclear Engineering Parallel:
+This is like running a batch of independent core depletion or sensitivity cases
+(e.g., an OpenMC or RELAP5 input-deck sweep) on a cluster, one case per node.
+"""
+
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import numpy as np
+from simulation_engine.builder import build_simulation
+from physics_models._kernels import NUMBA_AVAILABLE
+
+def run_sweep(configs, snapshot_dir="./assets/sweeps", max_workers=None):
+    """
+    Run one simulation per configuration in parallel worker processes.
+    :param configs: List of configuration dicts, each laid out like parameters.yaml.
+    :param snapshot_dir: Directory for the per-run snapshot files.
+    :param max_workers: Number of worker processes (defaults to the number of CPUs).
+    :return: List of (mass_history, snapshot_path) tuples, in the order of configs.
+             Load the snapshots of a run with np.load(snapshot_path).
+
+    Workers are spawned, so a calling script must guard its entry point with if __name__ == "__main__".
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    # The random tag keeps sweeps started in the same minute from overwriting each other's files
+    sweep_id = f"{datetime.now().strftime('%d_%H%M')}_{uuid.uuid4().hex[:8]}"
+    snapshot_paths = [os.path.join(snapshot_dir, f"{sweep_id}_run{i:03d}.npy") for i in range(len(configs))]
+
+    # Spawned (not forked) workers: forking after Numba's threading layer has started can deadlock
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker) as executor:
+        return list(executor.map(_run_one, configs, snapshot_paths))
+
+def _init_worker():
+    """
+    Limit each worker to a single Numba thread; the pool already spreads runs across the cores.
+    """
+    if NUMBA_AVAILABLE:
+        import numba
+        numba.set_num_threads(1)
+
+def _run_one(config, snapshot_path):
+    """
+    Build and run a single simulation, saving its snapshots to snapshot_path.
+    """
+    sim = build_simulation(config)
+    sim.run(log_interval=config['simulation']['log_interval'], save_snapshots=True,
+            water_source_height=config['erosion_model']['water_source_height'])
+
+    np.save(snapshot_path, sim.get_snapshots())
+    return sim.mass_history, snapshot_path
@@ -15,7 +15,7 @@ This plays the role of a transient solver driver (e.g., like in RELAP5 or COBRA)
 It integrates the physical model forward in time and collects diagnostics — similar to burnup solvers.
 """
 
-from copy import deepcopy
+import numpy as np
 from core_geometry.voxel_model import VoxelModel
 
 class TimeIntegrator:
@@ -30,17 +30,28 @@ class TimeIntegrator:
         self.eroder = erosion_model
         self.steps = steps
         self.mass_history = []
-        self.grid_snapshots = []  # Store grids for animation
+        # Store grids for animation, one frame per leading index
+        self.grid_snapshots = np.empty((0,) + voxel_model.grid.shape, dtype=voxel_model.grid.dtype)
 
-    def run(self, log_interval=10, save_snapshots=True, water_source_height=1.0):
+    def run(self, log_interval=10, save_snapshots=True, water_source_height=1.0, snapshot_interval=None):
         """
         Run the simulation.
         :param log_interval: Print status every N steps.
-        :param save_snapshots: Store voxel grid at each step.
+        :param save_snapshots: Store the voxel grid every snapshot_interval steps, plus the final grid
+                               (replaces snapshots from a previous run).
+        :param snapshot_interval: Store a snapshot every N steps (defaults to log_interval).
         """
+        if snapshot_interval is None:
+            snapshot_interval = log_interval
+
+        if save_snapshots:
+            # One contiguous (frames, nx, ny, nz) buffer: every snapshot_interval-th step plus the final grid
+            num_frames = len(range(0, self.steps, snapshot_interval)) + 1
+            self.grid_snapshots = np.empty((num_frames,) + self.vm.grid.shape, dtype=self.vm.grid.dtype)
+
         for step in range(self.steps):
-            if save_snapshots:
-                self.grid_snapshots.append(deepcopy(self.vm.grid))
+            if save_snapshots and step % snapshot_interval == 0:
+                self.grid_snapshots[step // snapshot_interval] = self.vm.grid
 
             self.eroder.apply(self.vm, water_source_height)
             mass = self.vm.get_mass()
@@ -51,10 +62,10 @@ class TimeIntegrator:
 
         # Save final grid if needed
         if save_snapshots:
-            self.grid_snapshots.append(deepcopy(self.vm.grid))
+            self.grid_snapshots[-1] = self.vm.grid
 
     def get_snapshots(self):
         """
-        Return the list of voxel grid snapshots (3D numpy arrays).
+        Return the voxel grid snapshots as a 4D numpy array indexed by frame.
         """
         return self.grid_snapshots
@@ -34,29 +34,35 @@ def animate_voxel_series(voxel_grids: List[np.ndarray], threshold=0.0, label="ru
     plotter = pv.Plotter(off_screen=True)
     plotter.open_gif(filename)
 
+    # Every grid in a run shares one shape, so the camera is the same for every frame
+    nx, ny, nz = voxel_grids[0].shape if len(voxel_grids) else (0, 0, 0)
+    camera_position = [
+        (-nx, -ny, -nz * 6.0),        # straight above
+        (nx / 2, ny / 2, nz / 2),     # focal point
+        (1, 1, 1)
+    ]
+    # Fixed color range so colors are comparable across frames; erosion only lowers values
+    clim = [threshold, float(np.max(voxel_grids[0])) if len(voxel_grids) else 1.0]
+
+    cloud = None  # The single mesh shown in every frame, updated in place
     for grid in voxel_grids:
         voxels = np.argwhere(grid > threshold)
-        voxels_int = np.array(voxels, dtype=int)         # For indexing
-        voxels_float = np.array(voxels, dtype=np.float32)  # For PyVista
 
         if voxels.size == 0:
             continue
 
-        cloud = pv.PolyData(voxels_float)
-        cloud['intactness'] = grid[tuple(voxels_int.T)]
+        frame = pv.PolyData(voxels.astype(np.float32, copy=False))
+        frame['intactness'] = grid[voxels[:, 0], voxels[:, 1], voxels[:, 2]]
 
-        plotter.clear()
-        plotter.camera_position = [
-            (-grid.shape[0],
-            -grid.shape[1],
-            -grid.shape[2] * 6.0),    # straight above
-            (grid.shape[0] / 2,
-            grid.shape[1] / 2,
-            grid.shape[2] / 2),      # focal point
-            (1, 1, 1)                
-        ]   
-        plotter.add_mesh(cloud, render_points_as_spheres=True, point_size=10,
-                         scalars='intactness', cmap='viridis')
+        if cloud is None:
+            cloud = frame
+            plotter.camera_position = camera_position
+            # Flat, unlit points render much faster than sphere impostors and read the same in a GIF
+            plotter.add_mesh(cloud, render_points_as_spheres=False, point_size=6, lighting=False,
+                             scalars='intactness', cmap='viridis', clim=clim)
+        else:
+            # Swap in this frame's points and scalars without rebuilding the actor
+            cloud.copy_from(frame, deep=False)
         plotter.write_frame()
 
     plotter.close()
@@ -26,22 +26,15 @@ def render_voxel_grid(grid, threshold=0.0, export_mesh=True, mesh_filename="asse
     - export_mesh (bool): If True, save visible voxels as a 3D .obj file.
     - mesh_filename (str): Path for saving the output mesh (default: ./assets/meshes/final_frame.obj).
     """
-    nx, ny, nz = grid.shape
-    voxels = []
-    for x in range(nx):
-        for y in range(ny):
-            for z in range(nz):
-                if grid[x, y, z] > threshold:
-                    voxels.append([x, y, z])
-
-    voxels = np.array(voxels, dtype=np.float32)  # Required float type for PyVista
+    mask = grid > threshold
+    voxels = np.argwhere(mask).astype(np.float32)  # Required float type for PyVista
 
     if len(voxels) == 0:
         print("No voxels to render.")
         return
 
     point_cloud = pv.PolyData(voxels)
-    point_cloud['intactness'] = grid[tuple(voxels.astype(int).T)]
+    point_cloud['intactness'] = grid[mask]  # same C order as argwhere
 
     # Export to .obj mesh if requested
     if export_mesh: